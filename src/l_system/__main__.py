@@ -13,10 +13,18 @@ def main() -> None:
         default=True,
         help="If provided, animate turtle movement. (default: False)",
     )
+    parser.add_argument(
+        "--progress",
+        "-p",
+        dest="show_progress",
+        action="store_true",
+        default=False,
+        help="If provided, show a progress bar in the terminal while rendering. (default: False)",
+    )
 
     args = parser.parse_args()
 
-    global_settings = GlobalSettings(args.animate)
+    global_settings = GlobalSettings(args.animate, args.show_progress)
     renderer = LSystemRenderer(global_settings)
     renderer.draw()
 
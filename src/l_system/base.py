@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Iterable
 
 import tqdm
 
+from l_system.fast_rewrite import RewriteTable, build_rewrite_table, rewrite
+
 
 class Lsystem(ABC):
     """L-Systems need to inherit this ABC."""
@@ -60,6 +63,11 @@ class Lsystem(ABC):
                 values that will be replaced with.
         """
 
+    @cached_property
+    def _rewrite_table(self) -> RewriteTable:
+        """The `productions` (rules) packed into a lookup table, built once per L-System instance."""
+        return build_rewrite_table(self.productions, self.axiom + "".join(self.productions.values()))
+
     @property
     def recursions(self) -> int:
         """How many times to recursively apply the productions rules."""
@@ -84,14 +92,20 @@ class Lsystem(ABC):
         if reset_state:
             self.reset_state()
 
+        table = self._rewrite_table
         for _ in tqdm.tqdm(range(n_recursions), desc="Applying the L-System production rules."):
-            next_state = []
-            for s in self._state:
-                next_v = self.productions.get(s)
-                next_state += next_v if next_v is not None else s
-            self._state = "".join(next_state)
+            self._state = rewrite(self._state, table)
         return self._state
 
+    def set_state(self, state: str) -> None:
+        """
+        Sets the state of the L-System, e.g. to a previously computed expansion of it.
+
+        Args:
+            state: The new state (string of symbols) of the L-System.
+        """
+        self._state = state
+
     def reset_state(self) -> None:
         """Resets the state of the L-System to it's `axiom`."""
         self._state = self.axiom
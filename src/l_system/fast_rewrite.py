@@ -0,0 +1,48 @@
+"""
+Fast rewriting of L-System states.
+
+The production rules of an L-System are packed once into a lookup table that maps every symbol to its replacement
+(symbols without a production rule are mapped to themselves). A whole generation is then rewritten by mapping the
+table over the state and joining the replacements, which keeps the rewriting loop in C instead of iterating and
+concatenating the symbols in Python.
+"""
+
+
+class RewriteTable(dict[str, str]):
+    """A lookup table of the production rules, symbols without a production rule are mapped to themselves."""
+
+    def __missing__(self, symbol: str) -> str:
+        return symbol
+
+
+def build_rewrite_table(productions: dict[str, str], symbols: str = "") -> RewriteTable:
+    """
+    Packs the production rules of an L-System into a lookup table.
+
+    Args:
+        productions: The production rules of an L-System, keys are the symbols to be replaced and values their
+            replacements.
+        symbols: Symbols that can appear in the state of the L-System. They are added to the table mapped to
+            themselves, so that looking them up never falls back to `RewriteTable.__missing__`.
+
+    Returns:
+        A lookup table to be used with `rewrite`.
+    """
+    table = RewriteTable((s, s) for s in symbols)
+    # The state is rewritten symbol by symbol, keys that are not single symbols can never be matched
+    table.update((k, v) for k, v in productions.items() if len(k) == 1)
+    return table
+
+
+def rewrite(state: str, table: RewriteTable) -> str:
+    """
+    Applies the production rules once on every symbol of the `state`.
+
+    Args:
+        state: The current state of an L-System (string of symbols).
+        table: The lookup table of the production rules, see `build_rewrite_table`.
+
+    Returns:
+        The next generation of the L-System's state.
+    """
+    return "".join(map(table.__getitem__, state))
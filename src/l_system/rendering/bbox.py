@@ -0,0 +1,133 @@
+"""
+Computes the bounding box of the area an `LSystemTurtle` would draw to, and the lines it would draw, without actually
+running the turtle.
+
+The turtle moves are simulated with plain floating point arithmetic (position, heading and a state stack), which is
+much cheaper than running the `turtle` graphics state machine a first time just to discover the min and max
+coordinates of the rendered L-System, or than moving the turtle when the drawing is not animated.
+"""
+
+import math
+from typing import List, Tuple
+
+from l_system.rendering.turtle import TurtleConfiguration
+
+BoundingBox = Tuple[float, float, float, float]
+Polyline = List[Tuple[float, float]]
+
+_FORWARD = ord('F')
+_UP_FORWARD = ord('f')
+_LEFT = ord('+')
+_RIGHT = ord('-')
+_PUSH = ord('[')
+_POP = ord(']')
+
+
+def _direction(heading: float, step: float) -> Tuple[float, float]:
+    """Returns the (dx, dy) displacement of a forward `step` towards `heading` (in degrees)."""
+    rad = math.radians(heading)
+    return step * math.cos(rad), step * math.sin(rad)
+
+
+def compute_bbox(moves: bytes, cfg: TurtleConfiguration) -> BoundingBox:
+    """
+    Computes the bounding box of all the positions the turtle visits, see `trace_polylines`.
+
+    Args:
+        moves: The turtle moves (`F`, `f`, `+`, `-`, `[`, `]`) of an L-System, after mapping its symbols with the
+            `turtle_move_mapper` of the turtle configuration, as ASCII bytes.
+        cfg: The turtle configuration used to render the L-System.
+
+    Returns:
+        The bounding box as an (x_min, y_min, x_max, y_max) tuple. It always contains the turtle's starting position
+            `(0, 0)`.
+
+    Raises:
+        KeyError: If a move is not a supported turtle move.
+    """
+    _, bbox = trace_polylines(moves, cfg)
+    return bbox
+
+
+def trace_polylines(moves: bytes, cfg: TurtleConfiguration) -> Tuple[List[Polyline], BoundingBox]:
+    """
+    Simulates the turtle `moves` and collects the lines the turtle draws as polylines, together with the bounding box
+    of all the positions the turtle visits. A new polyline is started every time the turtle moves without drawing
+    (`f`) or jumps back to a previously pushed state (`]`). Consecutive forward moves without a turn in between are
+    merged into a single straight segment.
+
+    Args:
+        moves: The turtle moves (`F`, `f`, `+`, `-`, `[`, `]`) of an L-System, after mapping its symbols with the
+            `turtle_move_mapper` of the turtle configuration, as ASCII bytes.
+        cfg: The turtle configuration used to render the L-System.
+
+    Returns:
+        The drawn polylines, each one a list of at least two (x, y) vertices, and the bounding box as an
+            (x_min, y_min, x_max, y_max) tuple. The bounding box always contains the turtle's starting position
+            `(0, 0)` and the positions it moved to without drawing.
+
+    Raises:
+        KeyError: If a move is not a supported turtle move.
+    """
+    delta = cfg.angle
+    step = cfg.forward_step
+    heading = float(cfg.initial_heading_angle)
+    dx, dy = _direction(heading, step)
+    x = y = 0.0
+    x_min = y_min = x_max = y_max = 0.0
+    polyline: Polyline = [(x, y)]
+    polylines: List[Polyline] = [polyline]
+    stack: List[Tuple[float, float, float]] = []
+    # Whether the last vertex of the polyline ends a forward move with the current heading
+    straight = False
+
+    for move in moves:
+        if move == _FORWARD or move == _UP_FORWARD:
+            x += dx
+            y += dy
+            if x < x_min:
+                x_min = x
+            elif x > x_max:
+                x_max = x
+            if y < y_min:
+                y_min = y
+            elif y > y_max:
+                y_max = y
+            if move == _UP_FORWARD:
+                straight = False
+                # Only start a new polyline if the current one has drawn anything
+                if len(polyline) > 1:
+                    polyline = [(x, y)]
+                    polylines.append(polyline)
+                else:
+                    polyline[0] = (x, y)
+            elif straight:
+                polyline[-1] = (x, y)
+            else:
+                polyline.append((x, y))
+                straight = True
+        elif move == _LEFT:
+            heading = (heading + delta) % 360
+            dx, dy = _direction(heading, step)
+            straight = False
+        elif move == _RIGHT:
+            heading = (heading - delta) % 360
+            dx, dy = _direction(heading, step)
+            straight = False
+        elif move == _PUSH:
+            stack.append((heading, x, y))
+        elif move == _POP:
+            heading, x, y = stack.pop()
+            dx, dy = _direction(heading, step)
+            straight = False
+            if len(polyline) > 1:
+                polyline = [(x, y)]
+                polylines.append(polyline)
+            else:
+                polyline[0] = (x, y)
+        else:
+            raise KeyError(f"{chr(move)} not found!")
+
+    if len(polyline) == 1:
+        polylines.pop()
+    return polylines, (x_min, y_min, x_max, y_max)
@@ -1,11 +1,13 @@
 import json
+import logging
 import tkinter as tk
 import turtle
+from collections import OrderedDict
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
 from tkinter import ttk
-from typing import Dict, Tuple
+from typing import ClassVar, Dict, List, Optional, Tuple, Type
 
 import tqdm
 from examples import (
@@ -29,78 +31,83 @@ from examples import (
 )
 
 from l_system.base import Lsystem
-from l_system.rendering.turtle import LSystemTurtle, TurtleConfiguration
+from l_system.rendering.bbox import BoundingBox, Polyline, trace_polylines
+from l_system.rendering.turtle import LSystemTurtle, TurtleConfiguration, translate_moves
 
-Example = Tuple[Lsystem, TurtleConfiguration]
+logger = logging.getLogger(__name__)
+
+Example = Tuple[Type[Lsystem], TurtleConfiguration]
 
 EXAMPLES_MAP: Dict[str, Example] = {
-    dragon_curve.DragonCurve.name(): (dragon_curve.DragonCurve(), dragon_curve.DEFAULT_TURTLE_CONFIG),
-    sierpinski_gask.SierpinskiGask.name(): (sierpinski_gask.SierpinskiGask(), sierpinski_gask.DEFAULT_TURTLE_CONFIG),
-    koch_island.KochIsland.name(): (koch_island.KochIsland(), koch_island.DEFAULT_TURTLE_CONFIG),
+    dragon_curve.DragonCurve.name(): (dragon_curve.DragonCurve, dragon_curve.DEFAULT_TURTLE_CONFIG),
+    sierpinski_gask.SierpinskiGask.name(): (sierpinski_gask.SierpinskiGask, sierpinski_gask.DEFAULT_TURTLE_CONFIG),
+    koch_island.KochIsland.name(): (koch_island.KochIsland, koch_island.DEFAULT_TURTLE_CONFIG),
     hexagonal_gosper_curve.HexagonalGosperCurve.name(): (
-        hexagonal_gosper_curve.HexagonalGosperCurve(),
+        hexagonal_gosper_curve.HexagonalGosperCurve,
         hexagonal_gosper_curve.DEFAULT_TURTLE_CONFIG,
     ),
     islands_and_lakes.IslandsAndLakes.name(): (
-        islands_and_lakes.IslandsAndLakes(),
+        islands_and_lakes.IslandsAndLakes,
         islands_and_lakes.DEFAULT_TURTLE_CONFIG,
     ),
     bracketed_ol_system_fig1_24a.BracketedOlSystemFig124a.name(): (
-        bracketed_ol_system_fig1_24a.BracketedOlSystemFig124a(),
+        bracketed_ol_system_fig1_24a.BracketedOlSystemFig124a,
         bracketed_ol_system_fig1_24a.DEFAULT_TURTLE_CONFIG,
     ),
     bracketed_ol_system_fig1_24b.BracketedOlSystemFig124b.name(): (
-        bracketed_ol_system_fig1_24b.BracketedOlSystemFig124b(),
+        bracketed_ol_system_fig1_24b.BracketedOlSystemFig124b,
         bracketed_ol_system_fig1_24b.DEFAULT_TURTLE_CONFIG,
     ),
     bracketed_ol_system_fig1_24c.BracketedOlSystemFig124c.name(): (
-        bracketed_ol_system_fig1_24c.BracketedOlSystemFig124c(),
+        bracketed_ol_system_fig1_24c.BracketedOlSystemFig124c,
         bracketed_ol_system_fig1_24c.DEFAULT_TURTLE_CONFIG,
     ),
     bracketed_ol_system_fig1_24d.BracketedOlSystemFig124d.name(): (
-        bracketed_ol_system_fig1_24d.BracketedOlSystemFig124d(),
+        bracketed_ol_system_fig1_24d.BracketedOlSystemFig124d,
         bracketed_ol_system_fig1_24d.DEFAULT_TURTLE_CONFIG,
     ),
     bracketed_ol_system_fig1_24f.BracketedOlSystemFig124f.name(): (
-        bracketed_ol_system_fig1_24f.BracketedOlSystemFig124f(),
+        bracketed_ol_system_fig1_24f.BracketedOlSystemFig124f,
         bracketed_ol_system_fig1_24f.DEFAULT_TURTLE_CONFIG,
     ),
     koch_curves_fig1_7b.QuadraticSnowFlakeCurve.name(): (
-        koch_curves_fig1_7b.QuadraticSnowFlakeCurve(),
+        koch_curves_fig1_7b.QuadraticSnowFlakeCurve,
         koch_curves_fig1_7b.DEFAULT_TURTLE_CONFIG,
     ),
     koch_curves_fig1_9a.KochCurvesFig19a.name(): (
-        koch_curves_fig1_9a.KochCurvesFig19a(),
+        koch_curves_fig1_9a.KochCurvesFig19a,
         koch_curves_fig1_9a.DEFAULT_TURTLE_CONFIG,
     ),
     koch_curves_fig1_9b.KochCurvesFig19b.name(): (
-        koch_curves_fig1_9b.KochCurvesFig19b(),
+        koch_curves_fig1_9b.KochCurvesFig19b,
         koch_curves_fig1_9b.DEFAULT_TURTLE_CONFIG,
     ),
     koch_curves_fig1_9c.KochCurvesFig19c.name(): (
-        koch_curves_fig1_9c.KochCurvesFig19c(),
+        koch_curves_fig1_9c.KochCurvesFig19c,
         koch_curves_fig1_9c.DEFAULT_TURTLE_CONFIG,
     ),
     koch_curves_fig1_9d.KochCurvesFig19d.name(): (
-        koch_curves_fig1_9d.KochCurvesFig19d(),
+        koch_curves_fig1_9d.KochCurvesFig19d,
         koch_curves_fig1_9d.DEFAULT_TURTLE_CONFIG,
     ),
     koch_curves_fig1_9e.KochCurvesFig19e.name(): (
-        koch_curves_fig1_9e.KochCurvesFig19e(),
+        koch_curves_fig1_9e.KochCurvesFig19e,
         koch_curves_fig1_9e.DEFAULT_TURTLE_CONFIG,
     ),
     koch_curves_fig1_9f.KochCurvesFig19f.name(): (
-        koch_curves_fig1_9f.KochCurvesFig19f(),
+        koch_curves_fig1_9f.KochCurvesFig19f,
         koch_curves_fig1_9f.DEFAULT_TURTLE_CONFIG,
     ),
 }
 
-DEFAULT_L_SYSTEM, DEFAULT_TURTLE_CONFIG = EXAMPLES_MAP[dragon_curve.DragonCurve.name()]
+DEFAULT_L_SYSTEM_CLS, DEFAULT_TURTLE_CONFIG = EXAMPLES_MAP[dragon_curve.DragonCurve.name()]
+DEFAULT_L_SYSTEM = DEFAULT_L_SYSTEM_CLS()
 
 
 @dataclass
 class GlobalSettings:
     animate: bool
+    show_progress: bool = False
 
 
 DEFAULT_ROOT_WIDTH = 400
@@ -109,13 +116,60 @@ DEFAULT_ROOT_HEIGHT = 400
 STATIC_PADDING = 5
 
 
+_TRACE_CACHE: Dict[Tuple, Tuple[List[Polyline], BoundingBox]] = {}
+"""Polylines and bounding boxes of previously rendered L-Systems, keyed by the L-System and the turtle configuration's
+geometry."""
+
+
+_EXPANSION_CACHE: OrderedDict[Tuple, str] = OrderedDict()
+"""Expansions of previously rendered L-Systems, keyed by `_expansion_key` and ordered from least to most recently
+used."""
+_EXPANSION_CACHE_SIZE = 64
+
+
+def _expansion_key(l_system: Lsystem) -> Tuple:
+    """
+    Returns:
+        A hashable key of everything that determines the expansion of a (deterministic) L-System: its axiom,
+            production rules and number of recursions.
+    """
+    return l_system.axiom, tuple(sorted(l_system.productions.items())), l_system.recursions
+
+
+def _expand(l_system: Lsystem) -> str:
+    """
+    Expand a (deterministic) L-System as many times as defined by its `recursions` property. The expansion only
+    depends on the `_expansion_key` of the L-System, so it is memoized to make re-selecting a previously rendered
+    L-System cheap. On a cache hit the L-System's state is set to the memoized expansion, as if it had been applied.
+
+    Args:
+        l_system: The L-System to expand.
+
+    Returns:
+        The state of the L-System after applying its production rules.
+    """
+    key = _expansion_key(l_system)
+    expanded = _EXPANSION_CACHE.get(key)
+    if expanded is None:
+        expanded = _EXPANSION_CACHE[key] = l_system.apply()
+        if len(_EXPANSION_CACHE) > _EXPANSION_CACHE_SIZE:
+            _EXPANSION_CACHE.popitem(last=False)
+    else:
+        _EXPANSION_CACHE.move_to_end(key)
+        l_system.set_state(expanded)
+    return expanded
+
+
 def check_var_isset(val: str) -> bool:
     if val is not None and val:
         return True
     return False
 
 
-class LSystemRenderer(tk.Tk):
+class LSystemRenderer(tk.Toplevel):
+    _shared_root: ClassVar[Optional[tk.Tk]] = None
+    """A hidden Tk root (Tcl interpreter) shared by all the renderer windows."""
+
     def __init__(
         self,
         global_settings: GlobalSettings,
@@ -123,6 +177,7 @@ class LSystemRenderer(tk.Tk):
         turtle_configuration: TurtleConfiguration = DEFAULT_TURTLE_CONFIG,
         width: int = DEFAULT_ROOT_WIDTH,
         height: int = DEFAULT_ROOT_HEIGHT,
+        build_menu: bool = True,
     ):
         """
         Renders an L-system (`l_system`) on screen using`turtle` graphics.
@@ -133,27 +188,54 @@ class LSystemRenderer(tk.Tk):
             turtle_configuration: A configuration object for the turtle rendering.
             width: Window width.
             height: Window height.
+            build_menu: If set to `True` a menu bar to select examples and change settings is added to the window. Set
+                it to `False` for headless or programmatic rendering where nobody interacts with the window.
         """
-        super().__init__()
+        # All renderers are windows of a single hidden root Tk, rather than starting a Tcl interpreter each
+        if LSystemRenderer._shared_root is None:
+            LSystemRenderer._shared_root = tk.Tk()
+            LSystemRenderer._shared_root.withdraw()
+        super().__init__(LSystemRenderer._shared_root)
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
         self.width = width
         self.height = height
         self.global_settings = global_settings
 
-        # Initialize a root Tk to manage the canvas within this single `LSystemRenderer`
         self.option_add("*tearOff", tk.FALSE)
         self._canvas = turtle.ScrolledCanvas(self, width=width, height=height)
         self._canvas.pack(side=tk.LEFT)
         self._screen = turtle.TurtleScreen(self._canvas)
+        # Canvas line items of the polylines drawn without the turtle, see `_draw_polylines`
+        self._polyline_items: List[int] = []
+
+        if build_menu:
+            self._build_menu()
+
+        self.set_system(l_system, turtle_configuration)
 
-        # Add a menu to select from existing examples
+    def destroy(self) -> None:
+        """
+        Destroys the renderer window. Once the last renderer window has been closed the shared root is destroyed too,
+        which ends every (nested) event loop like closing a single `tk.Tk` window would.
+        """
+        super().destroy()
+        shared_root = LSystemRenderer._shared_root
+        if shared_root is not None and not shared_root.winfo_children():
+            LSystemRenderer._shared_root = None
+            shared_root.destroy()
+
+    def _build_menu(self) -> None:
+        """Add a menu to select from existing examples and to open the settings modal."""
         menubar = tk.Menu(self)
         self.config(menu=menubar)
         file_menu = tk.Menu(menubar)
 
         examples_menu = tk.Menu(file_menu)
-        for lsystem, lsystem_config in EXAMPLES_MAP.values():
-            print(f"Registering L-System({lsystem.name()}) with turtle configuration: {lsystem_config}")
-            examples_menu.add_command(label=lsystem.name(), command=partial(self.set_system, lsystem, lsystem_config))
+        for lsystem_cls, lsystem_config in EXAMPLES_MAP.values():
+            logger.debug("Registering L-System(%s) with turtle configuration: %s", lsystem_cls.name(), lsystem_config)
+            examples_menu.add_command(
+                label=lsystem_cls.name(), command=partial(self.set_example, lsystem_cls, lsystem_config)
+            )
 
         file_menu.add_cascade(label="Select Example", menu=examples_menu)
         file_menu.add_separator()
@@ -162,8 +244,6 @@ class LSystemRenderer(tk.Tk):
         menubar.add_cascade(label="File", menu=file_menu, underline=0)
         menubar.add_command(label="Settings", command=self.settings_modal)
 
-        self.set_system(l_system, turtle_configuration)
-
     def settings_modal(self) -> None:
         """Initialize a pop-up modal to mutate global and turtle settings."""
 
@@ -232,7 +312,7 @@ class LSystemRenderer(tk.Tk):
             try:
                 # Select L-system by name
                 selected_name = l_system_name_var.get()
-                new_lsys, new_lsys_conf = EXAMPLES_MAP.get(selected_name)
+                new_lsys_cls, new_lsys_conf = EXAMPLES_MAP[selected_name]
                 # Set all turtle configuration modal closure vars
                 forward_step_var.set(new_lsys_conf.forward_step)
                 angle_var.set(new_lsys_conf.angle)
@@ -241,7 +321,7 @@ class LSystemRenderer(tk.Tk):
                 fg_color_var.set(json.dumps(new_lsys_conf.fg_color))
                 bg_color_var.set(json.dumps(new_lsys_conf.bg_color))
                 turtle_move_map_var.set(json.dumps(new_lsys_conf.turtle_move_mapper))
-                self.set_system(new_lsys, new_lsys_conf)
+                self.set_example(new_lsys_cls, new_lsys_conf)
             except (tk.TclError, KeyError) as ex:
                 print(f"Unable select pre-existing configuration: {ex}")
 
@@ -320,9 +400,21 @@ class LSystemRenderer(tk.Tk):
             fg_color=self._turtle_conf.fg_color,
         )
         self.wm_title(self.lsystem.name())
-        self.lsystem.apply()
+        self._progress_fmt = f"{self.lsystem.name()} | %.0f %%"
+        expanded = _expand(self.lsystem)
+        self._moves = translate_moves(expanded, self._turtle_conf.turtle_move_mapper)
         self.draw()
 
+    def set_example(self, l_system_cls: Type[Lsystem], turtle_config: TurtleConfiguration) -> None:
+        """
+        Instantiate an example L-System and render it, see `set_system`.
+
+        Args:
+            l_system_cls: The class of the example L-System to render.
+            turtle_config: Render the L-System according to this TurtleConfiguration.
+        """
+        self.set_system(l_system_cls(), turtle_config)
+
     def draw(self, save_to_eps_file: Path | None = None) -> None:
         """
         Draw the L-system on screen using the `turtle` Python module.
@@ -334,9 +426,16 @@ class LSystemRenderer(tk.Tk):
                 to `None` it will only render the L-System without storing it.
         """
         try:
-            self._update_world_coordinates()
+            self._clear_polylines()
+            polylines, bbox = self._trace()
+            self._update_world_coordinates(bbox)
+            # When not animating the tracer is off, so the screen is only repainted by the final `update()`
             self._turtle.animate(self.global_settings.animate)
-            self._run_all_moves()
+            if self.global_settings.animate:
+                self._run_all_moves(polylines, show_progress=self.global_settings.show_progress)
+            else:
+                # Nothing to animate, draw the final lines directly without moving the turtle
+                self._draw_polylines(polylines)
             self._turtle.hideturtle()
             self._turtle.update()
             if save_to_eps_file:
@@ -345,28 +444,89 @@ class LSystemRenderer(tk.Tk):
         except (turtle.Terminator, tk.TclError):
             print("Exiting...")
 
-    def _run_all_moves(self) -> None:
-        """Runs all the `turtle` moves of the L-system."""
-        for i, l_str in tqdm.tqdm(
-            enumerate(self.lsystem, start=1),
-            total=len(self.lsystem),
-            desc=f"Rendering L-System '{self.lsystem.name()}'",
-        ):
-            self.wm_title(f"{self.lsystem.name()} | {100*(i/len(self.lsystem)):.0f} %")
-            k = self._turtle_conf.turtle_move_mapper.get(l_str, l_str)
-            self._turtle.move(k)
-
-    def _update_world_coordinates(self) -> None:
-        """Updates the `turtle` world coordinates by first running the `turtle` on the L-System to find min, max
-        coordinates. Then it uses these values to make sure the final L-System is visible in the window.
+    def _draw_polylines(self, polylines: List[Polyline]) -> None:
         """
+        Draws polylines directly on the canvas with the foreground color, without moving the turtle. Each polyline is a
+        single canvas line item, instead of one item per turtle move.
 
-        # NOTE: This implementation is computationally expensive
-        self._turtle.reset()
-        self._turtle.animate(False)
-        self._run_all_moves()
+        Args:
+            polylines: The polylines drawn by the turtle moves of the L-System in world coordinates, see
+                `trace_polylines`.
+        """
+        # Same world to canvas transformation as the turtle screen, the canvas y-axis points down
+        xscale = self._screen.xscale
+        yscale = -self._screen.yscale
+        fill = "#" + "".join(f"{round(c * 255):02x}" for c in self._turtle_conf.fg_color)
+        for polyline in polylines:
+            coords = [c for x, y in polyline for c in (x * xscale, y * yscale)]
+            self._polyline_items.append(self._canvas.create_line(*coords, fill=fill))
+
+    def _clear_polylines(self) -> None:
+        """Deletes the canvas line items drawn by `_draw_polylines`."""
+        for item in self._polyline_items:
+            self._canvas.delete(item)
+        self._polyline_items.clear()
+
+    def _run_all_moves(self, polylines: List[Polyline], show_progress: bool = False) -> None:
+        """
+        Runs all the `turtle` moves of the L-system, by moving the turtle along the polylines it draws one segment at a
+        time.
+
+        Args:
+            polylines: The polylines drawn by the turtle moves of the L-System, see `trace_polylines`.
+            show_progress: If set to `True` a `tqdm` progress bar is shown, otherwise the moves are run without it.
+        """
+        # Progress is counted per drawn segment, a bracket-free L-System is a single polyline
+        total = sum(len(polyline) - 1 for polyline in polylines)
+        # Updating the window title is expensive, only do it when animating and at most ~200 times
+        title_step = max(1, total // 200)
+        inv_total = 100.0 / max(1, total)
+        animate = self.global_settings.animate
+        progress_bar = (
+            tqdm.tqdm(total=total, desc=f"Rendering L-System '{self.lsystem.name()}'") if show_progress else None
+        )
+        i = 0
+        for polyline in polylines:
+            self._turtle.jump_to(*polyline[0])
+            for x, y in polyline[1:]:
+                self._turtle.draw_to(x, y)
+                i += 1
+                if animate and (i % title_step == 0 or i == total):
+                    self.wm_title(self._progress_fmt % (i * inv_total))
+                if progress_bar is not None:
+                    progress_bar.update()
+        if progress_bar is not None:
+            progress_bar.close()
+
+    def _trace(self) -> Tuple[List[Polyline], BoundingBox]:
+        """
+        Simulates the `turtle` moves of the L-System once, see `trace_polylines`. The result is cached, so re-rendering
+        a previously rendered L-System skips the simulation.
+
+        Returns:
+            The polylines drawn by the turtle moves and the min, max coordinates the turtle visits.
+        """
+        conf = self._turtle_conf
+        trace_key = (
+            _expansion_key(self.lsystem),
+            conf.forward_step,
+            conf.angle,
+            conf.initial_heading_angle,
+            tuple(sorted(conf.turtle_move_mapper.items())),
+        )
+        trace = _TRACE_CACHE.get(trace_key)
+        if trace is None:
+            trace = _TRACE_CACHE[trace_key] = trace_polylines(self._moves, conf)
+        return trace
+
+    def _update_world_coordinates(self, bbox: BoundingBox) -> None:
+        """Updates the `turtle` world coordinates with the min, max coordinates of the simulated `turtle` moves of the
+        L-System, making sure the final L-System is visible in the window.
 
-        minx, miny, maxx, maxy = self._turtle.bounding_box.to_tuple()
+        Args:
+            bbox: The (x_min, y_min, x_max, y_max) coordinates the turtle visits, see `trace_polylines`.
+        """
+        minx, miny, maxx, maxy = bbox
         w = maxx - minx
         h = maxy - miny
         epsilon = 0.00001
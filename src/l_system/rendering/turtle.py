@@ -51,6 +51,31 @@ class TurtleConfiguration:
     """A dictionary that maps L-System symbols to turtle moves."""
 
 
+def translate_moves(state: str, turtle_move_mapper: dict[str, str]) -> bytes:
+    """
+    Maps the symbols of an L-System's state to turtle moves.
+
+    Args:
+        state: The state of an L-System (string of symbols).
+        turtle_move_mapper: A dictionary that maps L-System symbols to turtle moves, symbols that are not keys of the
+            dictionary are kept as they are.
+
+    Returns:
+        The turtle moves as ASCII bytes, so that they can be simulated by their code.
+    """
+    symbols = "".join(turtle_move_mapper)
+    moves = "".join(turtle_move_mapper.values())
+    if (
+        all(len(k) == 1 and len(v) == 1 for k, v in turtle_move_mapper.items())
+        and state.isascii()
+        and (symbols + moves).isascii()
+    ):
+        # ASCII symbols map to single turtle moves, translate the whole state at once
+        table = bytes.maketrans(symbols.encode("ascii"), moves.encode("ascii"))
+        return state.encode("ascii").translate(table)
+    return "".join(turtle_move_mapper.get(s, s) for s in state).encode("ascii")
+
+
 @dataclass(frozen=False)
 class TurtleBoundingBox:
     """A bounding box of the area the turtle has drawn to."""
@@ -77,8 +102,8 @@ class LSystemTurtle(turtle.RawTurtle):
         """
         A turtle class for rendering L-Systems.
         It has a stack to push and pop its state (heading and position).
-        It also stores the min and max positions it has visited in a bounding box which is used to adjust the
-        coordinates making sure the rendered L-System is visible on screen.
+        It also stores the min and max positions it has visited in a bounding box, kept for direct use of the turtle;
+        the renderer computes its bounding box without running the turtle, see `l_system.rendering.bbox`.
 
         Args:
             screen: The parent container `turtle.TurtleScreen`.
@@ -120,8 +145,8 @@ class LSystemTurtle(turtle.RawTurtle):
         self.color(*self._fg_color)
 
     def _update_bounding_box(self) -> None:
-        """Every time the turtle makes a move it updates its bounding box. This is used by the renderer to make sure
-        the final rendered L-System will be visible."""
+        """Every time the turtle makes a move it updates its bounding box. This is kept for direct use of the turtle,
+        the renderer uses `l_system.rendering.bbox` instead."""
         x, y = self.position()
 
         if x < self.bounding_box.x_min:
@@ -177,6 +202,17 @@ class LSystemTurtle(turtle.RawTurtle):
         except KeyError as exc:
             raise KeyError(f"{mv_cmd} not found!") from exc
 
+    def jump_to(self, x: float, y: float) -> None:
+        """Moves the turtle to the (x, y) world coordinates without drawing."""
+        super().up()
+        super().goto(x, y)
+        super().down()
+
+    def draw_to(self, x: float, y: float) -> None:
+        """Turns the turtle towards the (x, y) world coordinates and draws a line while moving there."""
+        super().setheading(super().towards(x, y))
+        super().goto(x, y)
+
     def forward(self, *args) -> None:
         """Moves the turtle forward and updates the turtle's bounding box."""
         super().forward(self._forward_step)
@@ -51,3 +51,17 @@ class KochCurve(Lsystem):
                 ),
             ),
         ]
+
+
+class ParametrizedCurve(Lsystem):
+    """An L-system whose production rule is given when it is instantiated."""
+
+    axiom = 'F'
+
+    def __init__(self, rule: str):
+        self._rule = rule
+        super().__init__()
+
+    @property
+    def productions(self) -> dict[str, str]:
+        return {'F': self._rule}
@@ -0,0 +1,50 @@
+"""Testing the bounding box and polyline computations of the turtle moves."""
+
+import pytest
+
+from l_system.rendering.bbox import compute_bbox, trace_polylines
+from l_system.rendering.turtle import TurtleConfiguration
+
+
+@pytest.mark.parametrize(
+    "moves, cfg, expected",
+    [
+        (b"", TurtleConfiguration(), (0, 0, 0, 0)),
+        (b"F+F+F+F", TurtleConfiguration(forward_step=1, angle=90), (0, 0, 1, 1)),
+        (b"F-F-F-F", TurtleConfiguration(forward_step=2, angle=90), (0, -2, 2, 0)),
+        (b"f+f", TurtleConfiguration(forward_step=1, angle=90, initial_heading_angle=90), (-1, 0, 0, 1)),
+        (b"F[+F]-F", TurtleConfiguration(forward_step=1, angle=90), (0, -1, 1, 1)),
+        (b"[+F][-F]F", TurtleConfiguration(forward_step=1, angle=90, initial_heading_angle=90), (-1, 0, 1, 1)),
+    ],
+)
+def test_compute_bbox(moves, cfg, expected):
+    """Testing the bounding box of simple turtle moves."""
+    assert compute_bbox(moves, cfg) == pytest.approx(expected)
+
+
+def test_compute_bbox_unknown_move():
+    """Testing that unsupported turtle moves raise a `KeyError`, like the turtle does."""
+    with pytest.raises(KeyError):
+        compute_bbox(b"FX", TurtleConfiguration())
+
+
+@pytest.mark.parametrize(
+    "moves, expected",
+    [
+        (b"", []),
+        (b"+-f", []),
+        (b"F+F", [[(0, 0), (1, 0), (1, 1)]]),
+        (b"FfF", [[(0, 0), (1, 0)], [(2, 0), (3, 0)]]),
+        (b"F[+F]-F", [[(0, 0), (1, 0), (1, 1)], [(1, 0), (1, -1)]]),
+        (b"[+F][-F]", [[(0, 0), (0, 1)], [(0, 0), (0, -1)]]),
+        (b"FFF", [[(0, 0), (3, 0)]]),
+        (b"FF[+F]F", [[(0, 0), (2, 0), (2, 1)], [(2, 0), (3, 0)]]),
+        (b"F+-F", [[(0, 0), (1, 0), (2, 0)]]),
+    ],
+)
+def test_trace_polylines(moves, expected):
+    """Testing the polylines drawn by simple turtle moves."""
+    polylines, _ = trace_polylines(moves, TurtleConfiguration(forward_step=1, angle=90))
+    assert len(polylines) == len(expected)
+    for polyline, expected_polyline in zip(polylines, expected, strict=True):
+        assert [c for v in polyline for c in v] == pytest.approx([c for v in expected_polyline for c in v])
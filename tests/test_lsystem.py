@@ -2,7 +2,7 @@
 
 import pytest
 
-from tests.constants import Algae, FractalTree, KochCurve
+from tests.constants import Algae, FractalTree, KochCurve, ParametrizedCurve
 
 
 @pytest.mark.parametrize("lsystem_cls", [Algae, FractalTree, KochCurve])
@@ -16,3 +16,9 @@ def test_lsystem(lsystem_cls):
             f"FAILED: '{lsystem_cls.name()}' L-system at iteration: {n}. ",
             f"Expected: '{expected}' != Actual: '{result}'",
         )
+
+
+def test_lsystem_instance_productions():
+    """Testing that instances of the same L-system class rewrite with their own production rules."""
+    assert ParametrizedCurve("F+F").apply(1) == "F+F"
+    assert ParametrizedCurve("FF").apply(1) == "FF"
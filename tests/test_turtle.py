@@ -0,0 +1,22 @@
+"""Testing the translation of L-system symbols to turtle moves."""
+
+import pytest
+
+from l_system.rendering.turtle import translate_moves
+
+
+@pytest.mark.parametrize(
+    "state, turtle_move_mapper, expected",
+    [
+        ("", {}, b""),
+        ("F+F", {}, b"F+F"),
+        ("A+B-A", {'A': 'F', 'B': 'F'}, b"F+F-F"),
+        ("X[+X]", {'X': 'F'}, b"F[+F]"),
+        ("XYX", {'X': '', 'Y': 'F+'}, b"F+"),
+        ("ABA", {'AB': 'F', '': '+'}, b"ABA"),
+        ("A", {'A': 'FF'}, b"FF"),
+    ],
+)
+def test_translate_moves(state, turtle_move_mapper, expected):
+    """Testing that every symbol is replaced by its mapped turtle moves."""
+    assert translate_moves(state, turtle_move_mapper) == expected